@@ -14,6 +14,9 @@ and allowing zooming/panning.
 
 import time
 
+import numpy as np
+from matplotlib.lines import Line2D
+
 from .interactive_object import InteractiveObject
 
 
@@ -149,7 +152,9 @@ class Cursor(InteractiveObject):
     - `visible`: bool, sets whether cursor drawn or not when in axes.
     - `inaxes`: book, true when mouse (and thus cursor) is in axes
     - `clicknumber`: track the number of recorded clicks.
-    - `clickdata`: stores the (x, y) data of clicks in a list.
+    - `clickdata`: (x, y) data of recorded clicks, as an array of shape (nclicks, 2).
+      Read-only property returning a copy (not a list that can be assigned or
+      appended to anymore); use `erase_data()` to reset it.
     - `marks`: list of matplotlib artists containing all click marks drawn.
     """
 
@@ -175,6 +180,16 @@ class Cursor(InteractiveObject):
 
     commands_all = commands_color_or_width + list(commands_misc.values())
 
+    fig_cursors = {}  # active cursor of each figure (only one per figure)
+
+    # Contrary to draggable objects, no self-picking here. Not listening to
+    # pick events at all spares Matplotlib the hit-testing of every artist
+    # in the figure at each click. Cursor, however, always follows the mouse.
+    event_callbacks = tuple((event, callback) for event, callback
+                            in InteractiveObject.event_callbacks
+                            if event != 'pick_event')
+    event_callbacks += (('motion_notify_event', 'on_motion'),)
+
     def __init__(self, ax=None, color=None, c=None,
                  linestyle=':', linewidth=1,
                  horizontal=True, vertical=True,
@@ -217,12 +232,33 @@ class Cursor(InteractiveObject):
         # Recording click data
         self.clicknumber = 0  # tracks the number of clicks
         self.n = n  # maximum number of clicks, after which cursor is deactivated
-        self.clickdata = []  # stores the (x, y) data of clicks in a list
+        # stores the (x, y) data of clicks (first nrecorded rows of array),
+        # array size is increased as needed (see clickdata property)
+        nrows = int(min(n, 1000)) if n >= 1 else 1000  # n <= 0 means no limit
+        self.clickarray = np.empty((nrows, 2))
+        self.nrecorded = 0
         self.marks = []  # list containing all artists drawn
 
+        # Methods called by on_key_press(), indexed by keyboard shortcut
+        self.key_actions = {
+            self.commands_misc['toggle visibility']: self._toggle_visibility,
+            self.commands_width['increase width']: self._increase_width,
+            self.commands_width['decrease width']: self._decrease_width,
+            self.commands_color['next color']: self._next_color,
+            self.commands_color['previous color']: self._previous_color,
+            self.commands_misc['add point']: self.manage_click,
+            self.commands_misc['remove point']: self.manage_click,
+        }
+
+        # Only one cursor per figure: delete the previous one if any
+        previous_cursor = Cursor.fig_cursors.get(self.fig)
+        if previous_cursor is not None:
+            previous_cursor.delete()
+        Cursor.fig_cursors[self.fig] = self
+
         # the blocking option below needs to be after connect()
         if self.block:
-            self.fig.canvas.start_event_loop(timeout=timeout)
+            self.canvas.start_event_loop(timeout=timeout)
 
     def __repr__(self):
 
@@ -256,36 +292,34 @@ class Cursor(InteractiveObject):
         self.created = True
 
         ax = self.ax
-        xmin, xmax = ax.get_xlim()
-        ymin, ymax = ax.get_ylim()
-
-        self.delete_others('fig')  # delete all other existing cursors on the figure
-
         x, y = event.xdata, event.ydata
 
         # horizontal and vertical cursor lines, the animated option is for blitting
+        # Lines spanning the axes are created as in axhline/axvline
+
+        line_options = {'color': self.color,
+                        'linewidth': self.width,
+                        'linestyle': self.style,
+                        'animated': InteractiveObject.blit}
 
         self.cursor_lines = {}
 
         if self.horizontal:
-            hline = ax.axhline(y=y, color=self.color,
-                               linewidth=self.width, linestyle=self.style,
-                               animated=InteractiveObject.blit)
+            hline = Line2D([0, 1], [y, y],
+                           transform=ax.get_yaxis_transform(which='grid'),
+                           **line_options)
             self.cursor_lines['horizontal'] = hline
 
         if self.vertical:
-            vline = ax.axvline(x=x, color=self.color,
-                               linewidth=self.width, linestyle=self.style,
-                               animated=InteractiveObject.blit)
+            vline = Line2D([x, x], [0, 1],
+                           transform=ax.get_xaxis_transform(which='grid'),
+                           **line_options)
             self.cursor_lines['vertical'] = vline
 
-        # because plotting the lines can change the initial xlim, ylim
-        ax.set_xlim(xmin, xmax)
-        ax.set_ylim(ymin, ymax)
-
         self.all_artists = tuple(self.cursor_lines.values())
+        self.add_artists(self.all_artists)
         # Note: addition to all_objects is made automatically by InteractiveObject parent class
-        InteractiveObject.moving_objects.add(self)
+        self.add_to_moving_objects()
 
         # Below is for cursor to be visible upon creation
         if InteractiveObject.blit:
@@ -293,7 +327,7 @@ class Cursor(InteractiveObject):
             self.draw_artists()        # for cursor to be immediately visible
             self.blit_canvas()         # for renrering artists on background
         else:
-            self.draw_canvas()
+            self.draw_canvas_idle()
 
     def update_position(self, event):
         """Update position of the cursor to follow mouse event."""
@@ -301,6 +335,9 @@ class Cursor(InteractiveObject):
         x = event.xdata  # For cursors it is sufficient to work with data coordinates
         y = event.ydata  # (no need to go to pixels as the cursor is always in axes)
 
+        if x is None or y is None:
+            return  # mouse outside of axes: cursor keeps last valid position
+
         if self.horizontal:
             hline = self.cursor_lines['horizontal']
             hline.set_ydata([y])
@@ -309,9 +346,33 @@ class Cursor(InteractiveObject):
             vline = self.cursor_lines['vertical']
             vline.set_xdata([x])
 
+    def update_appearance(self):
+        """Apply current color and width to the existing cursor lines."""
+        if not self.created:
+            return
+
+        for line in self.all_artists:
+            line.set_color(self.color)
+            line.set_linewidth(self.width)
+
+        if InteractiveObject.blit:
+            self.restore_background()
+            self.draw_artists()
+            self.blit_canvas()
+        else:
+            self.draw_canvas_idle()
+
     def reset_after_motion(self):
         pass
 
+    def delete(self, draw=True):
+        """Delete cursor and unregister it from the active figure cursors."""
+        try:
+            super().delete(draw=draw)
+        finally:  # so that a failed deletion does not block new cursors
+            if Cursor.fig_cursors.get(self.fig) is self:
+                del Cursor.fig_cursors[self.fig]
+
     def set_press_info(self, event):
         self.press_info = {'currently pressed': True,
                            'motion type': None,
@@ -325,23 +386,37 @@ class Cursor(InteractiveObject):
         """Erase plotted clicks (marks) without removing click data"""
         for mark in self.marks:
             mark.remove()
+        self.marks = []
+        self.draw_canvas_idle()
+
+    @property
+    def clickdata(self):
+        """(x, y) data of recorded clicks, as an array of shape (nclicks, 2).
+
+        Read-only: returns a copy, so that modifying it does not affect the
+        recorded data (use erase_data() to reset it).
+        """
+        return self.clickarray[:self.nrecorded].copy()
 
     def erase_data(self):
         """Erase data of recorded clicks"""
-        self.clickdata = []
+        self.nrecorded = 0
 
     def _record_click(self, position):
         """Record click data"""
-        self.clickdata.append(position)
+        if self.nrecorded == len(self.clickarray):  # full: double array size
+            self.clickarray = np.concatenate((self.clickarray,
+                                              np.empty_like(self.clickarray)))
+        self.clickarray[self.nrecorded] = position
+        self.nrecorded += 1
         self.clicknumber += 1
 
     def _unrecord_click(self):
         """Cancel click recording"""
-        if self.clicknumber == 0:
-            pass
-        else:
+        if self.clicknumber > 0:
             self.clicknumber -= 1
-            self.clickdata.pop(-1)  # remove last element
+        if self.nrecorded > 0:  # can differ from clicknumber after erase_data()
+            self.nrecorded -= 1
 
     def _draw_click(self, position):
         """Create click drawing"""
@@ -350,6 +425,16 @@ class Cursor(InteractiveObject):
                       style=self.markstyle)
         self.marks.append(mark)
 
+    def _blit_mark(self, mark):
+        """Add mark to the blitting background without redrawing the canvas."""
+        self.restore_background()  # to remove cursor lines from the canvas
+        for artist in mark.artists:
+            self.ax.draw_artist(artist)
+        self.update_background()   # background now includes the new mark
+        if self.created:
+            self.draw_artists()    # cursor on top of new background
+        self.blit_canvas()
+
     def _undraw_click(self):
         """Cancel click drawing"""
         if len(self.marks) == 0:
@@ -388,10 +473,59 @@ class Cursor(InteractiveObject):
 
             self._draw_click(position) if add else self._undraw_click()
 
-            self.draw_canvas()             # redraw to add/remove click mark
-            if InteractiveObject.blit:
-                self.update_background()   # store this as new background for blitting
-                self.blit_canvas()         # this makes cursor reappear
+            if add and InteractiveObject.blit and InteractiveObject.background is not None:
+                self._blit_mark(self.marks[-1])
+            else:
+                # redraw to add/remove click mark; if blitting, the background
+                # is updated and the cursor re-drawn on top in on_draw()
+                self.draw_canvas_idle()
+
+    def _check_stop(self, event):
+        """Delete cursor if max number of clicks reached or stop requested.
+
+        Works for mouse and key events; returns True if cursor was deleted.
+        """
+        try:
+            stop = (event.button == self.stopbutton)
+        except AttributeError:
+            stop = (event.key == self.commands_misc['stop'])
+
+        if self.clicknumber == self.n or stop:
+            if self.verbose:
+                print('Cursor disconnected (max number of clicks, or stop button pressed).')
+            self.delete()
+            return True
+
+        return False
+
+# ========================= keyboard controls (actions) ======================
+
+    def _toggle_visibility(self, event):
+        """Show / hide cursor"""
+        if self.inaxes:  # create or delete cursor only if it's in axes
+            self.erase() if self.visible else self.create(event)
+        self.visible = not self.visible  # always change visibility status
+
+    def _increase_width(self, event):
+        self.width += 0.5
+        self.update_appearance()
+
+    def _decrease_width(self, event):
+        self.width = self.width - 0.5 if self.width > 0.5 else 0.5
+        self.update_appearance()
+
+    def _next_color(self, event):
+        self._cycle_color(1)
+
+    def _previous_color(self, event):
+        self._cycle_color(-1)
+
+    def _cycle_color(self, step):
+        """Move by step in the list of colors (cyclically)"""
+        colors = InteractiveObject.colors
+        colorindex = (colors.index(self.color) + step) % len(colors)
+        self.color = colors[colorindex]
+        self.update_appearance()
 
 # ============================= callback methods =============================
 
@@ -415,6 +549,7 @@ class Cursor(InteractiveObject):
         Note that update_graph() is not called when other interactive objects
         are moving (and thus when a leader is already updating the graph),
         because this happens only when the mouse is currently pressed.
+        Graph updates are throttled to avoid lag when events arrive too fast.
         """
         # In case one missed the entry of mouse in axes (e.g. because Cursor
         # instantiated while mouse was already in axes)
@@ -434,13 +569,19 @@ class Cursor(InteractiveObject):
         # update cursor position during motion.
         if not self.press_info['currently pressed'] and self.visible and self.inaxes:
 
+            if event.inaxes is None:
+                return
+
             # Below is to tackle the case where Cursor() is called when the mouse
             # is already in axes
             if not self.created:
+                self.ax = event.inaxes
                 self.create(event)
+            elif event.inaxes is not self.ax:
+                return  # stale event, mouse has moved to other axes
 
             # Below is regular updating of graph to take into account cursor motion
-            self.update_graph(event)
+            self.throttled_update_graph(event)
 
     def on_mouse_press(self, event):
         """If mouse is pressed, deactivate cursor temporarily.
@@ -487,12 +628,10 @@ class Cursor(InteractiveObject):
 
         # See if cursor needs to re-appear or be deleted etc. ----------------
 
-        if self.clicknumber == self.n or event.button == self.stopbutton:
-            if self.verbose:
-                print('Cursor disconnected (max number of clicks, or stop button pressed).')
-            self.delete()
+        if self._check_stop(event):
+            return
 
-        elif self.visible and self.inaxes:
+        if self.visible and self.inaxes:
             self.create(event)
 
     def on_key_press(self, event):
@@ -506,49 +645,23 @@ class Cursor(InteractiveObject):
             - "z" : cancel last point
             - enter : stop recording
         """
-# ----------------- changes in appearance of cursor --------------------------
+        action = self.key_actions.get(event.key)
+        if action is not None:
+            action(event)
 
-        if event.key == self.commands_misc['toggle visibility']:  # Space Bar
-            if self.inaxes:  # create or delete cursor only if it's in axes
-                self.erase() if self.visible else self.create(event)
-            self.visible = not self.visible  # always change visibility status
+        self._check_stop(event)
 
-        elif event.key == self.commands_width['increase width']:
-            self.width += 0.5
+    def on_draw(self, event):
+        """Recapture blitting background each time the canvas is redrawn.
 
-        elif event.key == self.commands_width['decrease width']:
-            self.width = self.width - 0.5 if self.width > 0.5 else 0.5
-
-        elif event.key in self.commands_color.values():
-            # finds at which position the current color is in the list
-            colorindex = InteractiveObject.colors.index(self.color)
-            if event.key == self.commands_color['next color']:
-                colorindex += 1
-            else:
-                colorindex -= 1
-            colorindex = colorindex % len(InteractiveObject.colors)
-            self.color = InteractiveObject.colors[colorindex]
-
-        if event.key in self.commands_color_or_width:
-            self.erase()  # easy way to not have to update artist
-            self.create(event)
-
-# ------------------- recording or removing click data -----------------------
-
-        elif event.key in (self.commands_misc['add point'],
-                           self.commands_misc['remove point']):
-            self.manage_click(event)
-
-# ------------------------ stop if necessary ---------------------------------
-
-        if self.clicknumber == self.n or event.key == self.commands_misc['stop']:
-            if self.verbose:
-                print('Cursor disconnected (max number of clicks, or stop button pressed).')
-            self.delete()
-
-    def on_pick(self, event):
-        """Contrary to draggable objects, no self-picking here."""
-        pass
+        The full draw can come from anywhere (resizing, pan/zoom, other
+        artists being added, etc.), so that the background stored for
+        blitting is otherwise outdated. The cursor lines are animated and thus
+        excluded from the draw; they are re-drawn on top of the new background.
+        """
+        if InteractiveObject.blit and self.created:
+            self.update_background()
+            self.draw_artists()
 
 
 # =========================== ginput-like function ==========================
@@ -598,7 +711,7 @@ def ginput(n=1, timeout=0, show_clicks=True,
                mouse_add=mouse_add, mouse_stop=mouse_stop, mouse_pop=mouse_pop,
                marker=marker, marker_size=marker_size, marker_style=marker_style,
                blit=blit, visible=cursor, ax=ax, verbose=verbose)
-    data = c.clickdata
+    data = [tuple(position) for position in c.clickdata.tolist()]
     time.sleep(0.2)  # just to have time to see the last click and its mark
     c.erase_marks()
     return data
@@ -3,6 +3,8 @@
 Line, Rect and Cursor each subclass the InteractiveObject class defined here.
 """
 
+import time
+
 import matplotlib.pyplot as plt
 from matplotlib.colors import is_color_like
 
@@ -20,29 +22,63 @@ class InteractiveObject:
 
     name = 'Interactive Object'
 
-    all_interactive_objects = []  # tracking all instances of all subclasses
+    all_interactive_objects = {}  # tracking all instances of all subclasses
     # (use the all_instances() method to get instances of a single class)
-    # This list is returned by the classmethod all_objects().
+    # Dict used as an ordered set (values are None) for O(1) removal; the
+    # list of objects is returned by the classmethod all_objects().
 
-    moving_objects = set()  # objects currently moving on figure. Includes
+    moving_objects = []  # objects currently moving on figure. Includes
     # all subclasses, to be able to manage motion of objects of different
-    # classes on the same figure.
+    # classes on the same figure. A list (not a set) so that objects are
+    # always updated and drawn in the same order when moving.
+
+    moving_artists = []  # flat list of all artists of moving_objects, rebuilt
+    # each time moving_objects changes, to draw them in a single loop.
 
     leader = None  # Leader object that synchronizes motion and drawing of all
     # objects when several objects are selected/moving at the same time.
     # This feature is required due to blitting rendering issues.
 
-    initiating_motion = False  # True when the leading object had been selected
-
     # Attributes for fast rendering of motion with blitting.
     blit = True
     background = None
 
+    # Minimum time (s) between two graph updates when following the mouse.
+    # Motion events arriving faster than this are dropped (see
+    # throttled_update_graph), to avoid lag due to accumulating events.
+    motion_interval = 0.015
+
+    # Canvas events the objects listen to, with the name of the corresponding
+    # callback method (connected in connect()). Motion events are not listed
+    # here, because they are followed only by the leader during motion
+    # (see connect_motion()).
+    event_callbacks = (
+        # mouse events
+        ('button_press_event', 'on_mouse_press'),
+        ('button_release_event', 'on_mouse_release'),
+        ('pick_event', 'on_pick'),
+        # key events
+        ('key_press_event', 'on_key_press'),
+        ('key_release_event', 'on_key_release'),
+        # figure events
+        ('figure_enter_event', 'on_enter_figure'),
+        ('figure_leave_event', 'on_leave_figure'),
+        ('axes_enter_event', 'on_enter_axes'),
+        ('axes_leave_event', 'on_leave_axes'),
+        ('close_event', 'on_close'),
+        ('resize_event', 'on_resize'),
+        # drawing events
+        ('draw_event', 'on_draw'),
+    )
+
     # Define default colors of the class (potentially cycled through by some
     # methods. If user specifies a color not in the list, it is added to the
     # class colors.
     colors = ['crimson', 'dimgray', 'whitesmoke', 'dodgerblue', 'lightgreen']
 
+    # Results of color validation (is_color_like), to check each color once
+    checked_colors = dict.fromkeys(colors, True)
+
     def __init__(
         self,
         ax=None,
@@ -55,12 +91,14 @@ class InteractiveObject:
 
         self.ax = plt.gca() if ax is None else ax
         self.fig = self.ax.figure
+        self.canvas = self.fig.canvas  # avoids repeated lookups in callbacks
 
         # Connect matplotlib event handling to callback functions
+        self.cidmotion = None  # motion events connected only when needed
         self.connect()
 
         # Tracks instances of any interactive objects of any subclass.
-        self.all_interactive_objects.append(self)
+        InteractiveObject.all_interactive_objects[self] = None
 
         self.all_artists = []  # all artists the object is made of
         self.all_pts = []  # all individual tracking points the object is made of
@@ -72,8 +110,15 @@ class InteractiveObject:
 
         self.created = False  # True when artists defined, False when erased or not created
         self.moving = False  # faster way to check moving objects than to measure the length of moving_objects
+        self.initiating_motion = False  # True when leader just selected, before first motion
         self.press_info = {'currently pressed': False}  # stores useful useful mouse click information
 
+        # Throttling of graph updates during motion (see throttled_update_graph)
+        self.last_update = 0      # time of last graph update
+        self.pending_event = None  # last motion event that was not processed
+        self.motion_timer = None   # timer that processes the pending event
+        self.last_position = None  # last mouse position (px) taken into account
+
         # the last object to be instanciated dictates if blitting is true or not
         InteractiveObject.blit = blit
         # Reset leading artist when instanciating a new object
@@ -91,15 +136,7 @@ class InteractiveObject:
         if c is not None:
             color = c
 
-        if color is None:
-            self.color = InteractiveObject.colors[0]
-        elif not is_color_like(color):
-            print('Warning: color not recognized. Falling back to default.')
-            self.color = InteractiveObject.colors[0]
-        else:
-            self.color = color
-            if color not in InteractiveObject.colors:
-                InteractiveObject.colors.append(color)
+        self.color = self.register_color(color)
 
         # --------------------------------------------------------------------
 
@@ -113,13 +150,14 @@ class InteractiveObject:
         plt.get_current_fig_manager().show()
 
     def __repr__(self):
-        object_list = self.__class__.class_objects()
-        objects_on_fig = [obj for obj in object_list if obj.fig == self.fig]
-        n_on_fig = len(objects_on_fig)
-        try:
-            n = objects_on_fig.index(self) + 1
-        except ValueError:  # means object has been deleted
-            n = 'deleted'
+        # single pass on all objects to count and number objects on figure
+        n = 'deleted'  # stays so if object not found
+        n_on_fig = 0
+        for obj in InteractiveObject.all_interactive_objects:
+            if type(obj) is type(self) and obj.fig is self.fig:
+                n_on_fig += 1
+                if obj is self:
+                    n = n_on_fig
         return f'{self.name} #{n}/{n_on_fig} in Fig. {self.fig.number}.'
 
     def __str__(self):
@@ -131,57 +169,125 @@ class InteractiveObject:
 
     def update_background(self):
         """Update background for blitting mode"""
-        canvas = self.fig.canvas
+        canvas = self.canvas
         ax = self.ax
         InteractiveObject.background = canvas.copy_from_bbox(ax.bbox)
 
     def restore_background(self):
         """Restore background, for blitting mode"""
-        self.fig.canvas.restore_region(InteractiveObject.background)
+        self.canvas.restore_region(InteractiveObject.background)
 
     def draw_artists(self):
         """Draw all artists of object, for blitting mode"""
+        renderer = self.canvas.get_renderer()
         for artist in self.all_artists:
-            self.ax.draw_artist(artist)
+            artist.draw(renderer)
 
     def draw_canvas(self):
         """Draw canvas (expensive)"""
-        self.fig.canvas.draw()
+        self.canvas.draw()
+
+    def draw_canvas_idle(self):
+        """Request canvas drawing when GUI is idle (coalesces several requests)"""
+        self.canvas.draw_idle()
+
+    def draw_created(self):
+        """Draw newly created object on canvas.
+
+        An idle draw is enough: the background for blitting is not captured
+        here but when motion starts (see update_graph).
+        """
+        self.draw_canvas_idle()
+
+    def add_artists(self, artists):
+        """Add artists to axes without changing data limits or autoscaling.
+
+        add_artist() is used rather than plot(), so that creating objects
+        does not shift axes limits (no need to restore xlim, ylim afterwards).
+        """
+        for artist in artists:
+            self.ax.add_artist(artist)
 
     def blit_canvas(self):
         """Blit objects above background, to update animated objects"""
-        self.fig.canvas.blit(self.ax.bbox)
+        self.canvas.blit(self.ax.bbox)
 
 # ================================== methods =================================
 
     def update_graph(self, event):
         """Update graph with the moving artists. Called only by the leader."""
+        blit = InteractiveObject.blit  # local lookup, called at every motion
 
-        if InteractiveObject.blit and InteractiveObject.initiating_motion:
+        if blit and self.initiating_motion:
             self.draw_canvas()
             self.update_background()
-            InteractiveObject.initiating_motion = False
+            self.initiating_motion = False
 
-        if InteractiveObject.blit:
+        if blit:
             # without this line, the graph keeps all successive positions of
             # the cursor on the screen
             self.restore_background()
 
         # now the leader triggers update of all moving artists including itself
         for obj in InteractiveObject.moving_objects:
-
             # update position data of object depending on its motion mode
             obj.update_position(event)
 
-            # Draw all artists of the object (if not, some can miss in motion)
-            if InteractiveObject.blit:
-                obj.draw_artists()
-
-        # without this below, the graph is not updated
-        if InteractiveObject.blit:
+        if blit:
+            # Draw all moving artists (if not, some can miss in motion)
+            # (same as ax.draw_artist, but getting the renderer only once);
+            # artists of other figures cannot be drawn with this renderer
+            fig = self.fig
+            renderer = self.canvas.get_renderer()
+            for artist in InteractiveObject.moving_artists:
+                if artist.figure is fig:
+                    artist.draw(renderer)
+            # without this below, the graph is not updated
             self.blit_canvas()
         else:
-            self.draw_canvas()
+            self.draw_canvas_idle()  # coalesces redraws of successive motions
+
+    def throttled_update_graph(self, event):
+        """Same as update_graph(), but dropping events that come too fast.
+
+        Events arriving less than motion_interval after the last update are
+        not processed immediately. Instead, the most recent one is stored and
+        processed by a timer, so that the final position of the mouse is
+        always taken into account. Events where the mouse has not actually
+        moved are ignored.
+        """
+        position = event.x, event.y
+        if position == self.last_position:
+            return
+        self.last_position = position
+
+        if time.perf_counter() - self.last_update < self.motion_interval:
+            if self.pending_event is None:
+                self.start_motion_timer()
+            self.pending_event = event
+            return
+
+        self.pending_event = None
+        self.update_graph(event)
+        self.last_update = time.perf_counter()
+
+    def start_motion_timer(self):
+        """Start (and create if necessary) timer that flushes pending motion."""
+        if self.motion_timer is None:
+            interval = int(1000 * self.motion_interval)  # in ms
+            self.motion_timer = self.canvas.new_timer(interval=interval)
+            self.motion_timer.single_shot = True
+            self.motion_timer.add_callback(self.flush_motion)
+        self.motion_timer.start()
+
+    def flush_motion(self):
+        """Update graph with the last motion event dropped by throttling."""
+        if self.pending_event is None:
+            return
+        event = self.pending_event
+        self.pending_event = None
+        self.update_graph(event)
+        self.last_update = time.perf_counter()
 
     def initiate_motion(self, event):
         """Initiate motion and define leading artist that synchronizes plot.
@@ -198,9 +304,11 @@ class InteractiveObject:
             # artists have been defined as animated.
             # This is because the canvas.draw() and/or canvas_copy_from_bbox()
             # calls need to be made with all moving artists declared as animated
-            InteractiveObject.initiating_motion = True
+            self.initiating_motion = True
+            self.last_position = None
+            self.connect_motion()
 
-        InteractiveObject.moving_objects.add(self)
+        self.add_to_moving_objects()
         self.moving = True
         if InteractiveObject.blit:
             for artist in self.all_artists:
@@ -215,13 +323,15 @@ class InteractiveObject:
 
         # Transforms functions to go from px to data coords.
         # Need to be redefined if figure is resized or if zooming occurs
+        # (pxtodata is frozen, i.e. a static copy of the transform, because
+        # axes do not change during motion and it is called at every event)
         self.datatopx = self.ax.transData.transform  # transform between data coords to px coords.
-        self.pxtodata = self.ax.transData.inverted().transform  # pixels to data coordinates
+        self.pxtodata = self.ax.transData.inverted().frozen().transform  # pixels to data coordinates
 
     def reset_after_motion(self):
         """Reset attributes that should be active only during motion."""
 
-        self.picked_artists = set()
+        self.picked_artists.clear()  # reuse set instead of allocating a new one
         self.active_info = {}
         self.press_info = {'currently pressed': False}
         self.moving_positions = {}
@@ -232,19 +342,20 @@ class InteractiveObject:
                 artist.set_animated(False)
 
         # Reset class variables that store moving information
-        InteractiveObject.moving_objects.remove(self)
+        self.remove_from_moving_objects()
         if self is InteractiveObject.leader:
             InteractiveObject.leader = None
+        self.disconnect_motion()
 
         # Once all motion has stopped (i.e. no more moving objects that are not
         # a cursor -- by definition, cursor is always moving), redraw figure
-        # and add the objects (now stopped) to the blitting background
-        # This allows us to call draw() only once even if several objects were
-        # moving
+        # so that the objects (now stopped) are part of the figure again.
+        # This allows us to draw only once even if several objects were
+        # moving. The draw is requested when idle so that it does not block
+        # the release; the blitting background is captured again at the next
+        # motion, or by the cursor when the draw happens (see Cursor.on_draw)
         if len(InteractiveObject.non_cursor_moving_objects()) == 0:
-            self.draw_canvas()
-            if InteractiveObject.blit:
-                self.update_background()
+            self.draw_canvas_idle()
 
     def set_press_info(self, event):
         """Records information related to the mouse click, in px coordinates."""
@@ -262,38 +373,42 @@ class InteractiveObject:
         self.press_info = press_info
         self.moving_positions = moving_positions
 
-    def erase(self):
-        """Lighter than delete(), keeps object connected and referenced"""
+    def erase(self, draw=True):
+        """Lighter than delete(), keeps object connected and referenced
+
+        If draw is False, the canvas is not redrawn (e.g. when erasing several
+        objects in a row, so that the figure is drawn only once at the end).
+        """
         for artist in self.all_artists:
             artist.remove()
         self.all_artists = []
+        self.pending_event = None  # cancel throttled motion not yet processed
 
         if self.name == 'Cursor' and InteractiveObject.blit:
             # Cursor is always blitting so it suffices to restore background
-            # without re-drawing
-            self.restore_background()
-            self.blit_canvas()
+            # without re-drawing (nothing to do if cursor not drawn)
+            if self.created:
+                self.restore_background()
+                self.blit_canvas()
 
-        else:
-            self.draw_canvas()
-            if InteractiveObject.blit:
-                self.update_background()
+        elif draw:
+            # no need to update background here: it is captured again when
+            # motion starts, and the cursor recaptures it on draw events
+            self.draw_canvas_idle()
 
         # Below, check if Useful ???
         # Check if object is listed as still moving, and remove it.
-        moving_objects = InteractiveObject.moving_objects
-        if self in moving_objects:
-            moving_objects.remove(self)
+        self.remove_from_moving_objects()
 
         self.created = False
 
-    def delete(self):
+    def delete(self, draw=True):
         """Hard delete of object by removing its components and references"""
-        self.erase()
-        InteractiveObject.all_interactive_objects.remove(self)
+        self.erase(draw=draw)
+        del InteractiveObject.all_interactive_objects[self]
         self.disconnect()
         if self.block:
-            self.fig.canvas.stop_event_loop()
+            self.canvas.stop_event_loop()
 
     def delete_others(self, *args):
         """Delete other instances of the same class (eccluding parents/children)
@@ -305,7 +420,7 @@ class InteractiveObject:
         else:
             option, *_ = args
 
-        all_instances = InteractiveObject.class_objects()
+        all_instances = self.class_objects()
 
         if option == 'all':
             instances = all_instances
@@ -317,19 +432,17 @@ class InteractiveObject:
             raise ValueError(f"{option} is not a valid argument for delete_others(). "
                              "Possible values: 'all', 'fig', 'ax'.")
 
-        others = set(instances) - {self}
-        for other in others:
-            other.delete()
+        others = [obj for obj in instances if obj is not self]
+        InteractiveObject.delete_objects(others)
 
     def get_pt_position(self, pt, option='data'):
         """Gets point position as a tuple from matplotlib line object.
 
         Options : 'data' (axis data coords, default) or 'px' (pixel coords).
         """
-        # if orig=True (default), the format is not always consistent
-        xpt, ypt = pt.get_data(orig=False)
-        # convert numpy array to scalar, faster than unpacking
-        pos = xpt.item(), ypt.item()
+        # get_xydata() returns the (N, 2) array stored by the artist, without
+        # the copies made by get_data(); convert first row to python floats
+        pos = tuple(pt.get_xydata()[0].tolist())
         if option == 'data':
             return pos
         elif option == 'px':
@@ -347,7 +460,59 @@ class InteractiveObject:
     @classmethod
     def all_objects(cls):
         """Return all interactive objects, including parents and subclasses."""
-        return cls.all_interactive_objects
+        return list(cls.all_interactive_objects)
+
+    @staticmethod
+    def register_color(color):
+        """Return color to use for an object created with color=color.
+
+        Falls back to the default color if color is None or not valid; valid
+        colors not yet known are added to the colors shared by all classes.
+        Colors are kept as given by the user (not converted to RGBA), so that
+        e.g. names remain readable when cycling through colors.
+        """
+        colors = InteractiveObject.colors
+
+        if color is None:
+            return colors[0]
+
+        try:
+            valid = InteractiveObject.checked_colors[color]
+        except KeyError:
+            valid = is_color_like(color)
+            InteractiveObject.checked_colors[color] = valid
+        except TypeError:  # unhashable color (e.g. list), not cached
+            valid = is_color_like(color)
+
+        if not valid:
+            print('Warning: color not recognized. Falling back to default.')
+            return colors[0]
+
+        if color not in colors:
+            colors.append(color)
+        return color
+
+    def add_to_moving_objects(self):
+        """Add object to moving objects (if not already there)."""
+        moving_objects = InteractiveObject.moving_objects
+        if self not in moving_objects:
+            moving_objects.append(self)
+        # artists can change even if object already moving (e.g. Cursor.create)
+        InteractiveObject.update_moving_artists()
+
+    def remove_from_moving_objects(self):
+        """Remove object from moving objects (if present)."""
+        moving_objects = InteractiveObject.moving_objects
+        if self in moving_objects:
+            moving_objects.remove(self)
+            InteractiveObject.update_moving_artists()
+
+    @classmethod
+    def update_moving_artists(cls):
+        """Rebuild flat list of artists of all moving objects."""
+        InteractiveObject.moving_artists = [artist
+                                            for obj in cls.moving_objects
+                                            for artist in obj.all_artists]
 
     @classmethod
     def cursor_moving_objects(cls):
@@ -356,14 +521,23 @@ class InteractiveObject:
     @classmethod
     def non_cursor_moving_objects(cls):
         """Objects currently moving but which are not cursor"""
-        return set(cls.moving_objects) - set(cls.cursor_moving_objects())
+        return [obj for obj in cls.moving_objects if obj.name != 'Cursor']
 
     @classmethod
     def clear(cls):
         """Delete all interactive objects of the class and its subclasses."""
-        objects = [obj for obj in cls.all_objects()]  # needed to avoid iterating over decreasing set
+        # all_objects() is a copy, so the registry can shrink while iterating
+        cls.delete_objects(cls.all_objects())
+
+    @staticmethod
+    def delete_objects(objects):
+        """Delete several objects, drawing each concerned canvas only once."""
+        canvases = {}  # dict used as ordered set
         for obj in objects:
-            obj.delete()
+            obj.delete(draw=False)
+            canvases[obj.canvas] = None
+        for canvas in canvases:
+            canvas.draw_idle()
 
 # TO DEFINE IN SUBCLASSES ====================================================
 
@@ -386,52 +560,32 @@ class InteractiveObject:
 # ================= connect/disconnect events and callbacks ==================
 
     def connect(self):
-        """connect object to figure canvas events"""
-        # mouse events
-        self.cidpress = self.fig.canvas.mpl_connect('button_press_event',
-                                                    self.on_mouse_press)
-        self.cidrelease = self.fig.canvas.mpl_connect('button_release_event',
-                                                      self.on_mouse_release)
-        self.cidpick = self.fig.canvas.mpl_connect('pick_event',
-                                                   self.on_pick)
-        self.cidmotion = self.fig.canvas.mpl_connect('motion_notify_event',
-                                                     self.on_motion)
-        # key events
-        self.cidpressk = self.fig.canvas.mpl_connect('key_press_event',
-                                                     self.on_key_press)
-        self.cidreleasek = self.fig.canvas.mpl_connect('key_release_event',
-                                                       self.on_key_release)
-        # figure events
-        self.cidfigenter = self.fig.canvas.mpl_connect('figure_enter_event',
-                                                       self.on_enter_figure)
-        self.cidfigleave = self.fig.canvas.mpl_connect('figure_leave_event',
-                                                       self.on_leave_figure)
-        self.cidaxenter = self.fig.canvas.mpl_connect('axes_enter_event',
-                                                      self.on_enter_axes)
-        self.cidaxleave = self.fig.canvas.mpl_connect('axes_leave_event',
-                                                      self.on_leave_axes)
-        self.cidclose = self.fig.canvas.mpl_connect('close_event',
-                                                    self.on_close)
-        self.cidresize = self.fig.canvas.mpl_connect('resize_event',
-                                                     self.on_resize)
+        """connect object to figure canvas events (see cls.event_callbacks)"""
+        self.cids = [self.canvas.mpl_connect(event, getattr(self, callback))
+                     for event, callback in self.event_callbacks]
 
     def disconnect(self):
         """disconnect callback ids"""
-        # mouse events
-        self.fig.canvas.mpl_disconnect(self.cidpress)
-        self.fig.canvas.mpl_disconnect(self.cidrelease)
-        self.fig.canvas.mpl_disconnect(self.cidmotion)
-        self.fig.canvas.mpl_disconnect(self.cidpick)
-        # key events
-        self.fig.canvas.mpl_disconnect(self.cidpressk)
-        self.fig.canvas.mpl_disconnect(self.cidreleasek)
-        # figure events
-        self.fig.canvas.mpl_disconnect(self.cidfigenter)
-        self.fig.canvas.mpl_disconnect(self.cidfigleave)
-        self.fig.canvas.mpl_disconnect(self.cidaxenter)
-        self.fig.canvas.mpl_disconnect(self.cidaxleave)
-        self.fig.canvas.mpl_disconnect(self.cidclose)
-        self.fig.canvas.mpl_disconnect(self.cidresize)
+        for cid in self.cids:
+            self.canvas.mpl_disconnect(cid)
+        self.cids = []
+        self.disconnect_motion()
+
+    def connect_motion(self):
+        """Follow mouse motion events (only needed for the leader).
+
+        Matplotlib calls every connected callback at each mouse motion, so
+        idle objects do not listen to these events at all.
+        """
+        if self.cidmotion is None:
+            self.cidmotion = self.canvas.mpl_connect('motion_notify_event',
+                                                     self.on_motion)
+
+    def disconnect_motion(self):
+        """Stop following mouse motion events."""
+        if self.cidmotion is not None:
+            self.canvas.mpl_disconnect(self.cidmotion)
+            self.cidmotion = None
 
 # ============================= callback methods =============================
 
@@ -466,12 +620,15 @@ class InteractiveObject:
         if not self.moving:
             return
         # only the leader triggers moving events (others drawn in update_graph)
+        # motion events are coalesced so that redraws do not pile up
         if InteractiveObject.leader is self:
-            self.update_graph(event)
+            self.throttled_update_graph(event)
 
     def on_mouse_release(self, event):
         """When mouse released, reset attributes to non-moving"""
         if self in InteractiveObject.moving_objects:
+            if InteractiveObject.leader is self:
+                self.flush_motion()  # apply last position dropped by throttling
             self.reset_after_motion()
 
     # key events  ------------------------------------------------------------
@@ -508,6 +665,11 @@ class InteractiveObject:
         """Delete object if figure is closed"""
         self.delete()
 
+    # drawing events  --------------------------------------------------------
+
+    def on_draw(self, event):
+        pass
+
 
 
 if __name__ == '__main__':
@@ -5,7 +5,8 @@
 # TODO -- key press to make the line exactly vertical or horiztontal
 # TODO -- live indication of the slope of the line.
 
-import math as m
+import numpy as np
+from matplotlib.lines import Line2D
 
 from .interactive_object import InteractiveObject
 
@@ -72,8 +73,6 @@ class Line(InteractiveObject):
             verbose=verbose,
         )
 
-        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
-
         self.create(
             pickersize,
             self.color,
@@ -84,15 +83,10 @@ class Line(InteractiveObject):
             avoid_existing,
         )
 
-        # to prevent any shift in axes limits when instanciating line.
-        self.ax.set_xlim(xlim)
-        self.ax.set_ylim(ylim)
-
-        self.draw_canvas()
-        self.update_background()
+        self.draw_created()
 
         if self.block:
-            self.fig.canvas.start_event_loop(timeout=timeout)
+            self.canvas.start_event_loop(timeout=timeout)
 
     # ========================== main line methods ===========================
 
@@ -104,19 +98,18 @@ class Line(InteractiveObject):
         """Create the line and its components (pt1, pt2, link)"""
 
         # set position of line on screen so that it does not overlap others --
-        pos = self.__class__.set_initial_position(self, pickersize, avoid_existing)
+        pos = self.set_initial_position(pickersize, avoid_existing)
         (x1, y1), (x2, y2) = pos
 
         # create edge points -------------------------------------------------
-        pt1, = self.ax.plot(x1, y1, marker=ptstyle, color=color, markersize=ptsize)
-        pt2, = self.ax.plot(x2, y2, marker=ptstyle, color=color, markersize=ptsize)
+        pt1 = Line2D([x1], [y1], marker=ptstyle, color=color, markersize=ptsize)
+        pt2 = Line2D([x2], [y2], marker=ptstyle, color=color, markersize=ptsize)
 
         # create connecting line (link) ---------------------------------------
-        x1, y1 = self.get_pt_position(pt1, 'data')
-        x2, y2 = self.get_pt_position(pt2, 'data')
+        link = Line2D([x1, x2], [y1, y2], c=color,
+                      linestyle=linestyle, linewidth=linewidth)
 
-        link, = self.ax.plot([x1, x2], [y1, y2], c=color,
-                             linestyle=linestyle, linewidth=linewidth)
+        self.add_artists((pt1, pt2, link))
 
         # assemble lines and pts into "all" ----------------------------------
         self.link = link
@@ -140,49 +133,39 @@ class Line(InteractiveObject):
         xmin, xmax = self.ax.get_xlim()
         ymin, ymax = self.ax.get_ylim()
         # Move into px coordinates to avoid problems with nonlinear axes
-        xmin, ymin = self.datatopx((xmin, ymin))
-        xmax, ymax = self.datatopx((xmax, ymax))
+        pmin, pmax = self.datatopx([(xmin, ymin), (xmax, ymax)])
 
-        # default positions
-        x1, y1 = (1 - a1) * xmin + a1 * xmax, (1 - b1) * ymin + b1 * ymax
-        x2, y2 = (1 - a2) * xmin + a2 * xmax, (1 - b2) * ymin + b2 * ymax
+        # default positions (rows: edge points), axes extent computed once
+        pos = pmin + np.array([(a1, b1), (a2, b2)]) * (pmax - pmin)
 
         if avoid:
             mindist = 3 * pickersize  # min distance between pts to avoid overlapping
-            dragonax = []  # list of coords (px) of existing lines in the current axes
-
-            otherlines = set(self.class_objects()) - set([self])
-            for line in otherlines:
-                # if on same axis, record coords in a list to check overlap later
-                if line.ax is self.ax:
-                    pt1, pt2 = line.all_pts
-                    x1b, y1b = self.get_pt_position(pt1, 'px')
-                    x2b, y2b = self.get_pt_position(pt2, 'px')
-                    dragonax.append((x1b, y1b))
-                    dragonax.append((x2b, y2b))
-
-            while True:
-                for (xb, yb) in dragonax:
-                    d1 = m.hypot(x1 - xb, y1 - yb)
-                    d2 = m.hypot(x2 - xb, y2 - yb)
-                    dmin = min(d1, d2)
-                    if dmin < mindist:  # some of the points are too close
-                        x1 += -mindist  # shift everything in a parallel manner
-                        y1 += +mindist
-                        x2 += -mindist
-                        y2 += +mindist
-                        break
-                else:  # if the inner for loop finishes, it means all points are ok
-                    break  # --> exit the outside while loop
-
-        return self.pxtodata((x1, y1)), self.pxtodata((x2, y2))
+            # coords (data) of the pts of existing lines in the current axes
+            # (single pass on objects, no intermediate sets)
+            dragonax = [self.get_pt_position(pt, 'data')
+                        for line in self.class_objects()
+                        if line.ax is self.ax and line is not self
+                        for pt in line.all_pts]
+
+            if dragonax:
+                # all points converted to px in a single transform call
+                pts = self.datatopx(dragonax)
+                shift = np.array([-mindist, mindist])
+                mindist2 = mindist**2  # squared distances avoid square roots
+                # distances between both edge pts and all existing pts at once
+                while (np.square(pts - pos[:, None]).sum(axis=-1).min()
+                       < mindist2):
+                    pos += shift  # shift everything in a parallel manner
+
+        (x1, y1), (x2, y2) = self.pxtodata(pos).tolist()
+        return (x1, y1), (x2, y2)
 
     def set_active_info(self):
         """Set active/inactive points during motion and detect motion mode."""
 
         if len(self.picked_artists) == 1 and self.link in self.picked_artists:
             # only the line is selected --> move as a whole, make both self.pts active
-            active_pts = set(self.all_pts)
+            active_pts = self.all_pts  # already a tuple, no need to copy
 
         else:
             # in all other cases, the points that need to be active are
@@ -191,7 +174,8 @@ class Line(InteractiveObject):
             # they overlap), move the whole thing as a whole again. If nothing
             # is picked, nothing happens (should not happen because the current
             # method is only called for active objects)
-            active_pts = set(self.picked_artists) - {self.link}
+            active_pts = tuple(artist for artist in self.picked_artists
+                               if artist is not self.link)
 
         npts = len(active_pts)
 
@@ -228,13 +212,16 @@ class Line(InteractiveObject):
                 self.moving_positions[pt] = x0_pt + dx, y0_pt + dy
 
         # now apply the changes to the graph
+        # (both points converted to data coordinates in a single call)
+        pt1, pt2, link = self.all_artists
+        px_pos = [self.moving_positions[pt1], self.moving_positions[pt2]]
+        (x1, y1), (x2, y2) = self.pxtodata(px_pos).tolist()
+        data_pos = {pt1: (x1, y1), pt2: (x2, y2)}
+
         for pt in active_pts:
-            xnew, ynew = self.pxtodata(self.moving_positions[pt])
+            xnew, ynew = data_pos[pt]
             pt.set_data([xnew], [ynew])
 
-        pt1, pt2, link = self.all_artists
-        x1, y1 = self.pxtodata(self.moving_positions[pt1])
-        x2, y2 = self.pxtodata(self.moving_positions[pt2])
         link.set_data([x1, x2], [y1, y2])
 
     def get_position(self):
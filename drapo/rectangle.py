@@ -5,6 +5,8 @@
 # TODO -- add possibility to interactively change color
 
 
+from matplotlib.lines import Line2D
+
 from .interactive_object import InteractiveObject
 
 
@@ -70,8 +72,6 @@ class Rect(InteractiveObject):
             verbose=verbose,
         )
 
-        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
-
         self.create(
             pickersize,
             position,
@@ -81,15 +81,10 @@ class Rect(InteractiveObject):
             linewidth,
         )
 
-        # to prevent any shift in axes limits when instanciating line. The
-        self.ax.set_xlim(xlim)
-        self.ax.set_ylim(ylim)
-
-        self.draw_canvas()
-        self.update_background()
+        self.draw_created()
 
         if self.block:
-            self.fig.canvas.start_event_loop(timeout=timeout)
+            self.canvas.start_event_loop(timeout=timeout)
 
     def create(
         self,
@@ -106,9 +101,9 @@ class Rect(InteractiveObject):
 
         # Create center of rectangle -----------------------------------------
         x_center, y_center = positions[-1]
-        center, = self.ax.plot(
-            x_center,
-            y_center,
+        center = Line2D(
+            [x_center],
+            [y_center],
             marker='+',
             c=self.color,
             markersize=ptsize,
@@ -117,8 +112,10 @@ class Rect(InteractiveObject):
         # Create all vertices (corners) of the rectangle ---------------------
         corners = []
         for pos in corner_positions:
-            pt, = self.ax.plot(
-                *pos,
+            x, y = pos
+            pt = Line2D(
+                [x],
+                [y],
                 marker=ptstyle,
                 c=self.color,
                 markersize=ptsize,
@@ -130,7 +127,7 @@ class Rect(InteractiveObject):
         for i, pos in enumerate(corner_positions):
             x1, y1 = corner_positions[i - 1]
             x2, y2 = pos
-            line, = self.ax.plot(
+            line = Line2D(
                 [x1, x2],
                 [y1, y2],
                 c=self.color,
@@ -148,6 +145,8 @@ class Rect(InteractiveObject):
         self.all_artists = (*corners, *lines, center)
         self.all_pts = (*corners, center)
 
+        self.add_artists((center, *corners, *lines))
+
         # make all components of the objects pickable ------------------------
         for artist in self.all_artists:
             artist.set_picker(True)
@@ -174,14 +173,13 @@ class Rect(InteractiveObject):
         corner 0   --------------------- corner 1
                            line 1
         """
-        xmin, xmax = self.ax.get_xlim()
-        ymin, ymax = self.ax.get_ylim()
-
-        # Move into px coordinates to avoid problems with nonlinear axes
-        xmin, ymin = self.datatopx((xmin, ymin))
-        xmax, ymax = self.datatopx((xmax, ymax))
-
+        # Work in px coordinates to avoid problems with nonlinear axes
+        # (points are transformed together, in a single call for each step)
         if position is None:
+            xmin, xmax = self.ax.get_xlim()
+            ymin, ymax = self.ax.get_ylim()
+            (xmin, ymin), (xmax, ymax) = self.datatopx([(xmin, ymin),
+                                                        (xmax, ymax)])
             w, h = .5, .5  # relative initial width/height of rectangle in axes
             x_left = (1 - w) / 2 * (xmax - xmin) + xmin
             x_right = (1 + w) / 2 * (xmax - xmin) + xmin
@@ -189,19 +187,19 @@ class Rect(InteractiveObject):
             y_high = (1 + h) / 2 * (ymax - ymin) + ymin
         else:
             x0, y0, width, height = position
-            x_left, y_low = self.datatopx((x0, y0))
-            x_right, y_high = self.datatopx((x0 + width, y0 + height))
+            (x_left, y_low), (x_right, y_high) = self.datatopx(
+                [(x0, y0), (x0 + width, y0 + height)])
 
         x_center = (x_left + x_right) / 2
         y_center = (y_low + y_high) / 2
 
-        pos1 = self.pxtodata((x_left, y_low))
-        pos2 = self.pxtodata((x_right, y_low))
-        pos3 = self.pxtodata((x_right, y_high))
-        pos4 = self.pxtodata((x_left, y_high))
-        posc = self.pxtodata((x_center, y_center))
+        positions = self.pxtodata([(x_left, y_low),      # corner 0
+                                   (x_right, y_low),     # corner 1
+                                   (x_right, y_high),    # corner 2
+                                   (x_left, y_high),     # corner 3
+                                   (x_center, y_center)])
 
-        return pos1, pos2, pos3, pos4, posc
+        return tuple(tuple(pos) for pos in positions.tolist())
 
     @staticmethod
     def corners_to_edge(icorner1, icorner2):
@@ -391,14 +389,19 @@ class Rect(InteractiveObject):
             self.moving_positions[self.center] = (x1 + x2) / 2, (y1 + y2) / 2
 
         # now apply the changes to the graph ---------------------------------
+        # (all points converted to data coordinates in a single transform call)
+        pts = self.all_pts
+        data = self.pxtodata([self.moving_positions[pt] for pt in pts])
+        positions = dict(zip(pts, data.tolist()))
+
         for pt in active_pts:
-            xnew, ynew = self.pxtodata(self.moving_positions[pt])
+            xnew, ynew = positions[pt]
             pt.set_data([xnew], [ynew])
 
         for line in active_lines:
             i = self.edges.index(line)
-            x1, y1 = self.pxtodata(self.moving_positions[self.corners[i - 1]])
-            x2, y2 = self.pxtodata(self.moving_positions[self.corners[i]])
+            x1, y1 = positions[self.corners[i - 1]]
+            x2, y2 = positions[self.corners[i]]
             line.set_data([x1, x2], [y1, y2])
 
 # ============================= callback methods =============================
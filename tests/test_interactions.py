@@ -0,0 +1,175 @@
+"""Tests of interactions with drapo objects, using simulated mouse events.
+
+These tests use the non-interactive Agg backend, so that they can run
+without any GUI.
+"""
+
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent
+import numpy as np
+import pytest
+
+from drapo import Line, Rect, Cursor
+from drapo.interactive_object import InteractiveObject
+
+
+@pytest.fixture(autouse=True)
+def agg_backend():
+    """Run each test with the Agg backend and remove all objects afterwards."""
+    plt.switch_backend('Agg')
+    yield
+    InteractiveObject.clear()
+    plt.close('all')
+
+
+def make_axes():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1, 2], [0, 1, 4])
+    fig.canvas.draw()
+    return ax
+
+
+def mouse(canvas, name, x, y, button=None):
+    """Send mouse event of given name at pixel position (x, y)."""
+    event = MouseEvent(name, canvas, x, y, button=button)
+    canvas.callbacks.process(name, event)
+
+
+def click(canvas, x, y, button=1):
+    mouse(canvas, 'button_press_event', x, y, button)
+    mouse(canvas, 'button_release_event', x, y, button)
+
+
+def pt_px(obj, pt):
+    return np.array(obj.get_pt_position(pt, 'px'))
+
+
+def near(position, expected):
+    """Compare pixel positions (mouse events have integer coordinates)."""
+    return np.allclose(position, expected, atol=1)
+
+
+# =============================== Line / Rect ================================
+
+
+def test_drag_line():
+    """Dragging a point of a line follows the mouse, even outside of axes."""
+    ax = make_axes()
+    canvas = ax.figure.canvas
+    line = Line(ax=ax)
+    pt, other = line.all_pts
+    x, y = pt_px(line, pt)
+    other_position = pt_px(line, other)
+
+    x0, _ = ax.transAxes.transform((0, 0))
+    mouse(canvas, 'button_press_event', x, y, 1)
+    mouse(canvas, 'motion_notify_event', x0 - 20, y + 10)
+    mouse(canvas, 'button_release_event', x0 - 20, y + 10, 1)
+
+    assert near(pt_px(line, pt), (x0 - 20, y + 10))
+    assert near(pt_px(line, other), other_position)
+    assert not line.moving
+    assert InteractiveObject.leader is None
+
+
+def test_motion_throttle_flushed_on_release(monkeypatch):
+    """Motion events dropped by throttling are applied on mouse release."""
+    monkeypatch.setattr(InteractiveObject, 'motion_interval', 1000)
+    ax = make_axes()
+    canvas = ax.figure.canvas
+    line = Line(ax=ax)
+    pt = line.all_pts[0]
+    x, y = pt_px(line, pt)
+
+    mouse(canvas, 'button_press_event', x, y, 1)
+    mouse(canvas, 'motion_notify_event', x + 5, y + 5)  # processed
+    mouse(canvas, 'motion_notify_event', x + 10, y + 10)  # dropped
+    mouse(canvas, 'motion_notify_event', x + 15, y + 15)  # dropped
+    assert near(pt_px(line, pt), (x + 5, y + 5))
+
+    mouse(canvas, 'button_release_event', x + 15, y + 15, 1)
+    assert near(pt_px(line, pt), (x + 15, y + 15))
+    assert line.pending_event is None
+
+
+def test_autoscale_kept():
+    """Creating objects does not change axes limits or disable autoscaling."""
+    ax = make_axes()
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+
+    Line(ax=ax)
+    Rect(ax=ax)
+    Cursor(ax=ax)
+
+    assert ax.get_autoscale_on()
+    assert ax.get_xlim() == xlim
+    assert ax.get_ylim() == ylim
+
+    ax.plot([0, 10], [0, 100])
+    assert ax.get_xlim()[1] >= 10
+    assert ax.get_ylim()[1] >= 100
+
+
+def test_delete_others():
+    """delete_others() removes other objects of the same class only."""
+    ax1 = make_axes()
+    ax2 = make_axes()
+    line = Line(ax=ax1)
+    line_same_ax = Line(ax=ax1)
+    line_other_fig = Line(ax=ax2)
+    rect = Rect(ax=ax1)
+
+    line.delete_others('fig')
+    assert line_same_ax not in InteractiveObject.all_objects()
+    assert line_other_fig in InteractiveObject.all_objects()
+
+    line.delete_others()
+    assert set(InteractiveObject.all_objects()) == {line, rect}
+
+    with pytest.raises(ValueError):
+        line.delete_others('figure')
+
+
+# ================================= Cursor ===================================
+
+
+def test_one_cursor_per_figure():
+    """Creating a cursor replaces the previous cursor of the same figure."""
+    ax1 = make_axes()
+    ax2 = make_axes()
+    cursor1 = Cursor(ax=ax1)
+    cursor2 = Cursor(ax=ax2)
+    cursor3 = Cursor(ax=ax1)
+
+    objects = InteractiveObject.all_objects()
+    assert cursor1 not in objects
+    assert cursor2 in objects
+    assert cursor3 in objects
+
+
+def test_clickdata():
+    """clickdata is a read-only copy of recorded clicks, as an array."""
+    ax = make_axes()
+    canvas = ax.figure.canvas
+    cursor = Cursor(ax=ax, record_clicks=True, n=np.inf)
+    assert cursor.clickdata.shape == (0, 2)
+
+    positions = (0.5, 1), (1.5, 2)
+    for position in positions:
+        x, y = ax.transData.transform(position)
+        mouse(canvas, 'motion_notify_event', x, y)
+        click(canvas, x, y)
+
+    data = cursor.clickdata
+    assert isinstance(data, np.ndarray)
+    assert np.allclose(data, positions, atol=0.05)
+
+    data[0] = 0, 0
+    assert np.allclose(cursor.clickdata, positions, atol=0.05)
+
+    with pytest.raises(AttributeError):
+        cursor.clickdata = []
+
+    cursor.erase_data()
+    assert cursor.clickdata.shape == (0, 2)